@@ -33,6 +33,7 @@ import com.example.a2achatassistant.data.ToolContext
 import kotlin.time.Duration.Companion.days
 import kotlinx.datetime.Clock
 import kotlinx.serialization.json.Json
+import kotlinx.serialization.json.JsonObject
 import kotlinx.serialization.json.decodeFromJsonElement
 import kotlinx.serialization.json.jsonObject
 import org.json.JSONArray
@@ -94,12 +95,19 @@ class ShoppingTools(context: Context, private val merchantAgent: A2aClient) {
     try {
       val rpcResponse = json.decodeFromJsonElement<JsonRpcResponse<ArtifactResult>>(responseJson)
       val listCartMandate = mutableListOf<CartMandate>()
-      rpcResponse.result.artifacts.mapNotNull { artifact ->
-        // Every artifact is a cart mandate
-        val part = artifact.parts.firstOrNull { it.kind == "data" } ?: return@mapNotNull null
-        // Directly deserialize into the rich Cart object
-        val wrapper = json.decodeFromJsonElement<FullCartMandateWrapper>(part.data)
-        listCartMandate.add(wrapper.cartMandate)
+      rpcResponse.result.artifacts.forEach { artifact ->
+        // An artifact can carry several carts, one per data part, next to a
+        // risk_data part; only the parts holding a cart mandate are decoded
+        artifact.parts
+          .filter { part ->
+            part.kind == "data" &&
+              (part.data as? JsonObject)?.containsKey("ap2.mandates.CartMandate") == true
+          }
+          .forEach { part ->
+            // Directly deserialize into the rich Cart object
+            val wrapper = json.decodeFromJsonElement<FullCartMandateWrapper>(part.data)
+            listCartMandate.add(wrapper.cartMandate)
+          }
       }
       toolContext.state.productOptions = listCartMandate
       return listCartMandate
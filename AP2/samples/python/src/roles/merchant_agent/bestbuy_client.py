@@ -14,12 +14,84 @@
 
 """Best Buy API client for fetching real product data."""
 
+import asyncio
+import atexit
+import collections
+import itertools
+import logging
 import os
+import re
+import time
 from typing import Any
 import httpx
 from pydantic import BaseModel
+from pydantic import TypeAdapter
+from pydantic import ValidationError
+import pydantic_core
 from google import genai
 
+logger = logging.getLogger(__name__)
+
+# Category detection is a pure function of the normalized query, so repeated
+# searches reuse the previous answer instead of paying for another LLM call.
+_CATEGORY_CACHE_MAXSIZE = 1024
+_category_cache: collections.OrderedDict[str, str | None] = (
+    collections.OrderedDict()
+)
+
+
+def _get_cached_category(query_norm: str) -> tuple[bool, str | None]:
+    """Look up a detected category, returning (hit, category_id)."""
+    if query_norm not in _category_cache:
+        return False, None
+    _category_cache.move_to_end(query_norm)
+    return True, _category_cache[query_norm]
+
+
+def _cache_category(query_norm: str, category_id: str | None) -> None:
+    """Store a detected category, evicting the least recently used entry."""
+    _category_cache[query_norm] = category_id
+    _category_cache.move_to_end(query_norm)
+    if len(_category_cache) > _CATEGORY_CACHE_MAXSIZE:
+        _category_cache.popitem(last=False)
+
+
+# Categories offered to the LLM; static, so the prompt is built once. The
+# query goes last so every request shares the same cacheable prompt prefix.
+_CATEGORY_LIST_STR = "\n".join(f"- {key}: {desc}" for key, desc in [
+    ("computers", "All computers and tablets"),
+    ("laptops", "Laptop computers"),
+    ("desktops", "Desktop computers"),
+    ("tablets", "Tablets and iPads"),
+    ("tvs", "Televisions and home theater"),
+    ("appliances", "Home appliances"),
+    ("refrigerators", "Refrigerators and freezers"),
+    ("headphones", "Headphones and earbuds"),
+    ("cameras", "Cameras and camcorders"),
+    ("phones", "Cell phones and smartphones"),
+    ("gaming", "Video games and gaming consoles"),
+    ("audio", "Audio equipment and speakers"),
+    ("smart_home", "Smart home devices"),
+    ("wearables", "Wearable technology like smartwatches"),
+    ("coffee_makers", "Coffee makers and espresso machines"),
+    ("cables", "Cables and connectors"),
+    ("accessories", "Computer accessories"),
+    ("chargers", "Chargers and power adapters"),
+])
+
+_CATEGORY_PROMPT_TEMPLATE = f"""Select the BEST category for the product search at the end from these options:
+{_CATEGORY_LIST_STR}
+
+RULES:
+1. Return ONLY the category key (one word like "laptops" or "cables")
+2. Choose most specific match (e.g., "cables" for "USB cables", not "accessories")
+3. If user wants cables/adapters/chargers, use those specific categories
+4. If no good match exists, return: none
+5. DO NOT explain, DO NOT add formatting, JUST ONE WORD
+
+Product search: "{{query}}"
+Category:"""
+
 
 class BestBuyProduct(BaseModel):
     """Represents a product from Best Buy API."""
@@ -37,6 +109,207 @@ class BestBuyProduct(BaseModel):
     onlineAvailability: bool | None = None
 
 
+# Batch validator for a page of Best Buy API results
+_PRODUCT_LIST_ADAPTER = TypeAdapter(list[BestBuyProduct])
+_REQUIRED_PRODUCT_FIELDS = ("sku", "name", "salePrice")
+
+
+# Demo product database organized by category, built once at import
+_DEMO_CATALOG = {
+    "coffee": [
+        BestBuyProduct(
+            sku=6446101,
+            name="Keurig K-Elite Single-Serve K-Cup Pod Coffee Maker",
+            salePrice=169.99,
+            regularPrice=189.99,
+            manufacturer="Keurig",
+            modelNumber="K90",
+            shortDescription="Brew your favorite coffee, tea, hot cocoa and more with this Keurig K-Elite coffee maker.",
+            image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6446/6446101_sd.jpg",
+            url="https://www.bestbuy.com/site/6446101.p",
+            customerReviewAverage=4.5,
+            inStoreAvailability=True,
+            onlineAvailability=True,
+        ),
+        BestBuyProduct(
+            sku=6120833,
+            name="Ninja 12-Cup Programmable Coffee Maker",
+            salePrice=89.99,
+            regularPrice=99.99,
+            manufacturer="Ninja",
+            modelNumber="CE251",
+            shortDescription="Classic coffee maker with advanced features for a perfect cup every time.",
+            image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6120/6120833_sd.jpg",
+            url="https://www.bestbuy.com/site/6120833.p",
+            customerReviewAverage=4.7,
+            inStoreAvailability=True,
+            onlineAvailability=True,
+        ),
+        BestBuyProduct(
+            sku=6372886,
+            name="Mr. Coffee 5-Cup Mini Brew Coffee Maker",
+            salePrice=24.99,
+            regularPrice=29.99,
+            manufacturer="Mr. Coffee",
+            modelNumber="BVMC-PSTX",
+            shortDescription="Compact coffee maker perfect for small spaces.",
+            image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6372/6372886_sd.jpg",
+            url="https://www.bestbuy.com/site/6372886.p",
+            customerReviewAverage=4.2,
+            inStoreAvailability=True,
+            onlineAvailability=True,
+        ),
+    ],
+    "laptop": [
+        BestBuyProduct(
+            sku=6534616,
+            name="MacBook Air 13.6\" Laptop - Apple M2 chip - 8GB Memory - 256GB SSD",
+            salePrice=999.99,
+            regularPrice=1199.99,
+            manufacturer="Apple",
+            modelNumber="MLY33LL/A",
+            shortDescription="Supercharged by M2 chip for incredible performance.",
+            image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6534/6534616_sd.jpg",
+            url="https://www.bestbuy.com/site/6534616.p",
+            customerReviewAverage=4.8,
+            inStoreAvailability=True,
+            onlineAvailability=True,
+        ),
+        BestBuyProduct(
+            sku=6515649,
+            name="HP 15.6\" Touch-Screen Laptop - Intel Core i5 - 8GB Memory - 256GB SSD",
+            salePrice=499.99,
+            regularPrice=599.99,
+            manufacturer="HP",
+            modelNumber="15-dy2795wm",
+            shortDescription="Reliable performance for everyday computing.",
+            image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6515/6515649_sd.jpg",
+            url="https://www.bestbuy.com/site/6515649.p",
+            customerReviewAverage=4.3,
+            inStoreAvailability=True,
+            onlineAvailability=True,
+        ),
+        BestBuyProduct(
+            sku=6542175,
+            name="Dell Inspiron 2-in-1 14\" Touch-Screen Laptop - Intel Core i7 - 16GB Memory",
+            salePrice=799.99,
+            regularPrice=999.99,
+            manufacturer="Dell",
+            modelNumber="I7420-7683BLU-PUS",
+            shortDescription="Versatile 2-in-1 design for work and entertainment.",
+            image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6542/6542175_sd.jpg",
+            url="https://www.bestbuy.com/site/6542175.p",
+            customerReviewAverage=4.6,
+            inStoreAvailability=False,
+            onlineAvailability=True,
+        ),
+    ],
+    "headphones": [
+        BestBuyProduct(
+            sku=6505727,
+            name="Sony WH-1000XM5 Wireless Noise-Cancelling Over-the-Ear Headphones",
+            salePrice=349.99,
+            regularPrice=399.99,
+            manufacturer="Sony",
+            modelNumber="WH1000XM5/B",
+            shortDescription="Industry-leading noise cancellation with premium sound quality.",
+            image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6505/6505727_sd.jpg",
+            url="https://www.bestbuy.com/site/6505727.p",
+            customerReviewAverage=4.9,
+            inStoreAvailability=True,
+            onlineAvailability=True,
+        ),
+        BestBuyProduct(
+            sku=6447909,
+            name="Apple AirPods Pro (2nd generation) with MagSafe Case",
+            salePrice=199.99,
+            regularPrice=249.99,
+            manufacturer="Apple",
+            modelNumber="MTJV3AM/A",
+            shortDescription="Active Noise Cancellation and Transparency mode.",
+            image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6447/6447909_sd.jpg",
+            url="https://www.bestbuy.com/site/6447909.p",
+            customerReviewAverage=4.8,
+            inStoreAvailability=True,
+            onlineAvailability=True,
+        ),
+        BestBuyProduct(
+            sku=6428457,
+            name="Beats Studio3 Wireless Noise Cancelling Over-Ear Headphones",
+            salePrice=199.99,
+            regularPrice=349.99,
+            manufacturer="Beats by Dr. Dre",
+            modelNumber="MX3X2LL/A",
+            shortDescription="Pure adaptive noise canceling with premium sound.",
+            image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6428/6428457_sd.jpg",
+            url="https://www.bestbuy.com/site/6428457.p",
+            customerReviewAverage=4.5,
+            inStoreAvailability=True,
+            onlineAvailability=True,
+        ),
+    ],
+    "tv": [
+        BestBuyProduct(
+            sku=6536735,
+            name='Samsung 65" Class QLED 4K UHD Smart Tizen TV',
+            salePrice=897.99,
+            regularPrice=1299.99,
+            manufacturer="Samsung",
+            modelNumber="QN65Q60CAFXZA",
+            shortDescription="Quantum Dot technology for brilliant colors.",
+            image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6536/6536735_sd.jpg",
+            url="https://www.bestbuy.com/site/6536735.p",
+            customerReviewAverage=4.6,
+            inStoreAvailability=True,
+            onlineAvailability=True,
+        ),
+        BestBuyProduct(
+            sku=6522019,
+            name='LG 55" Class OLED evo C3 Series Smart TV',
+            salePrice=1299.99,
+            regularPrice=1799.99,
+            manufacturer="LG",
+            modelNumber="OLED55C3PUA",
+            shortDescription="Self-lit OLED pixels for perfect black and infinite contrast.",
+            image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6522/6522019_sd.jpg",
+            url="https://www.bestbuy.com/site/6522019.p",
+            customerReviewAverage=4.8,
+            inStoreAvailability=False,
+            onlineAvailability=True,
+        ),
+        BestBuyProduct(
+            sku=6501901,
+            name='TCL 50" Class S4 4K UHD HDR LED Smart TV with Google TV',
+            salePrice=249.99,
+            regularPrice=329.99,
+            manufacturer="TCL",
+            modelNumber="50S450G",
+            shortDescription="Stunning 4K picture quality at an incredible value.",
+            image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6501/6501901_sd.jpg",
+            url="https://www.bestbuy.com/site/6501901.p",
+            customerReviewAverage=4.4,
+            inStoreAvailability=True,
+            onlineAvailability=True,
+        ),
+    ],
+}
+
+# Query keywords mapped to demo products, checked in order
+_DEMO_KEYWORDS = {
+    "coffee": _DEMO_CATALOG["coffee"],
+    "laptop": _DEMO_CATALOG["laptop"],
+    "headphone": _DEMO_CATALOG["headphones"],
+    "earbud": _DEMO_CATALOG["headphones"],
+    "tv": _DEMO_CATALOG["tv"],
+    "television": _DEMO_CATALOG["tv"],
+}
+
+# Default: all demo products, used when no keyword matches
+_DEFAULT_DEMO_PRODUCTS = list(
+    itertools.chain.from_iterable(_DEMO_CATALOG.values())
+)
+
+
 class BestBuyClient:
     """Client for interacting with Best Buy Products API."""
 
@@ -64,6 +337,74 @@ class BestBuyClient:
         "chargers": "abcat0515031",  # Chargers & Adapters
     }
 
+    # Head nouns that name a category, mapped to CATEGORY_MAP keys. Plurals
+    # ("laptops") match too; see _HEAD_KEYWORD_RE.
+    KEYWORD_TO_CATEGORY = {
+        "laptop": "laptops",
+        "notebook": "laptops",
+        "chromebook": "laptops",
+        "macbook": "laptops",
+        "desktop": "desktops",
+        "tablet": "tablets",
+        "ipad": "tablets",
+        "tv": "tvs",
+        "television": "tvs",
+        "refrigerator": "refrigerators",
+        "fridge": "refrigerators",
+        "headphone": "headphones",
+        "earbud": "headphones",
+        "airpods": "headphones",
+        "camera": "cameras",
+        "camcorder": "cameras",
+        "phone": "phones",
+        "smartphone": "phones",
+        "iphone": "phones",
+        "console": "gaming",
+        "playstation": "gaming",
+        "xbox": "gaming",
+        "speaker": "audio",
+        "soundbar": "audio",
+        "smartwatch": "wearables",
+        "coffee maker": "coffee_makers",
+        "coffeemaker": "coffee_makers",
+        "coffee machine": "coffee_makers",
+        "espresso machine": "coffee_makers",
+        "espresso maker": "coffee_makers",
+        "cable": "cables",
+        "charger": "chargers",
+    }
+    # After this many consecutive API failures, serve demo products for
+    # CIRCUIT_OPEN_SECONDS instead of waiting on the timeout every request.
+    CIRCUIT_FAILURE_THRESHOLD = 3
+    CIRCUIT_OPEN_SECONDS = 30
+
+    # Accessory/consumable name fragments excluded server-side unless the
+    # query itself asks for them (Best Buy supports != with wildcards).
+    # "case" is deliberately absent: earbuds ship "with Charging Case".
+    EXCLUDED_NAME_TERMS = (
+        "filter", "refill", "replacement", "cable", "adapter",
+    )
+    # Other query words that also lift an exclusion: chargers are sold as
+    # "power adapters", so a charger search has to keep them.
+    EXCLUSION_ALIASES = {"adapter": ("charger",)}
+    # Categories whose own products carry an excluded term in their names.
+    EXCLUSION_CATEGORIES = {"cable": "cables", "adapter": "chargers"}
+
+    # A keyword only decides the category when it is the query's head noun:
+    # the last word before any qualifier ("for", "under", ...), optionally
+    # plural and followed only by model tokens ("iphone 15 pro", "xbox
+    # series x"). "laptop bag" or "tv wall mount" go to the LLM instead.
+    _QUALIFIER_RE = re.compile(
+        r"\s+(?:for|under|below|over|above|around|with|without|between"
+        r"|less than|near|from|that)\b.*$"
+    )
+    _HEAD_KEYWORD_RE = re.compile(
+        r"\b(" + "|".join(
+            sorted(map(re.escape, KEYWORD_TO_CATEGORY), key=len, reverse=True)
+        ) + r")(?:e?s)?"
+        r"(?:\s+(?:\d\w*|pro|air|max|mini|plus|ultra|series|[a-z]))*$"
+    )
+
     def __init__(self, api_key: str | None = None):
         """Initialize the Best Buy API client.
 
@@ -73,8 +414,24 @@ class BestBuyClient:
         """
         self.api_key = api_key or os.getenv("BESTBUY_API_KEY")
         self.demo_mode = self.api_key is None
-        self.client = httpx.AsyncClient(timeout=10.0)
+        # HTTP/2 plus a keep-alive pool lets concurrent searches share one
+        # TLS connection to api.bestbuy.com instead of handshaking per call.
+        self.client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30,
+            ),
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            base_url=self.BASE_URL,
+        )
         self.llm_client = None  # Lazy initialize for category detection
+        # Background category detections kept alive until they finish
+        self._pending_tasks: set[asyncio.Task] = set()
+        # Circuit breaker state for Best Buy outages
+        self._fail_count = 0
+        self._open_until = 0.0
 
     async def _estimate_price_range(self, query: str) -> tuple[float, float | None]:
         """Use LLM to estimate reasonable price range for product type.
@@ -105,7 +462,7 @@ Example responses:
 {{"min": 500, "max": null}} for high-end products"""
 
         try:
-            response = self.llm_client.models.generate_content(
+            response = await self.llm_client.aio.models.generate_content(
                 model="gemini-2.5-flash",
                 contents=prompt,
                 config={
@@ -125,18 +482,41 @@ Example responses:
             min_price = float(result.get("min", 0))
             max_price = float(result["max"]) if result.get("max") is not None else None
 
-            print(f"[Price Estimation] Query: '{query}' → Range: ${min_price}-${max_price or 'unlimited'}")
+            logger.debug(
+                "[Price Estimation] Query: '%s' → Range: $%s-$%s",
+                query, min_price, max_price or "unlimited",
+            )
             return (min_price, max_price)
 
         except Exception as e:
-            print(f"[Price Estimation] Error: {e}, using default range")
+            logger.warning("[Price Estimation] Error: %s, using default range", e)
             return (0, None)  # Failsafe: no price filter
 
-    async def _detect_category(self, query: str) -> str | None:
-        """Use LLM to detect the best product category for a search query.
+    def _lookup_category(self, query_norm: str) -> tuple[bool, str | None]:
+        """Resolve a category without the LLM, returning (hit, category_id).
+
+        Args:
+            query_norm: Stripped, lower-cased search query
+        """
+        # Skip the LLM when the query's head noun names a category
+        head = self._QUALIFIER_RE.sub("", query_norm).rstrip("?!.,")
+        match = self._HEAD_KEYWORD_RE.search(head)
+        if match:
+            category_key = self.KEYWORD_TO_CATEGORY[match.group(1)]
+            return True, self.CATEGORY_MAP[category_key]
+
+        return _get_cached_category(query_norm)
+
+    async def _detect_category_with_llm(
+        self, query: str, query_norm: str
+    ) -> str | None:
+        """Use LLM to detect the best product category and cache the answer.
+
+        Called when _lookup_category has no keyword or cache hit.
 
         Args:
             query: Natural language search query
+            query_norm: Stripped, lower-cased query, used as the cache key
 
         Returns:
             Best Buy category ID or None if no good match
@@ -144,63 +524,36 @@ Example responses:
         if self.llm_client is None:
             self.llm_client = genai.Client()
 
-        # Create list of available categories
-        category_list = "\n".join([f"- {key}: {desc}" for key, desc in [
-            ("computers", "All computers and tablets"),
-            ("laptops", "Laptop computers"),
-            ("desktops", "Desktop computers"),
-            ("tablets", "Tablets and iPads"),
-            ("tvs", "Televisions and home theater"),
-            ("appliances", "Home appliances"),
-            ("refrigerators", "Refrigerators and freezers"),
-            ("headphones", "Headphones and earbuds"),
-            ("cameras", "Cameras and camcorders"),
-            ("phones", "Cell phones and smartphones"),
-            ("gaming", "Video games and gaming consoles"),
-            ("audio", "Audio equipment and speakers"),
-            ("smart_home", "Smart home devices"),
-            ("wearables", "Wearable technology like smartwatches"),
-            ("coffee_makers", "Coffee makers and espresso machines"),
-            ("cables", "Cables and connectors"),
-            ("accessories", "Computer accessories"),
-            ("chargers", "Chargers and power adapters"),
-        ]])
-
-        prompt = f"""Given product search: "{query}"
-
-Select the BEST category from these options:
-{category_list}
-
-RULES:
-1. Return ONLY the category key (one word like "laptops" or "cables")
-2. Choose most specific match (e.g., "cables" for "USB cables", not "accessories")
-3. If user wants cables/adapters/chargers, use those specific categories
-4. If no good match exists, return: none
-5. DO NOT explain, DO NOT add formatting, JUST ONE WORD
-
-Category:"""
+        prompt = _CATEGORY_PROMPT_TEMPLATE.format(query=query)
 
         try:
-            response = self.llm_client.models.generate_content(
+            response = await self.llm_client.aio.models.generate_content(
                 model="gemini-2.5-flash",
                 contents=prompt,
                 config={
                     "response_mime_type": "application/json",
-                    "response_schema": {"type": "string"}
+                    "response_schema": {"type": "string"},
+                    # One quoted word: no reasoning, tiny decode budget
+                    "max_output_tokens": 16,
+                    "temperature": 0,
+                    "thinking_config": {"thinking_budget": 0},
                 }
             )
 
             category_key = response.parsed.strip().lower()
-            print(f"[Category Detection] Query: '{query}' → Category: '{category_key}'")
+            logger.debug(
+                "[Category Detection] Query: '%s' → Category: '%s'",
+                query, category_key,
+            )
 
-            if category_key in self.CATEGORY_MAP:
-                return self.CATEGORY_MAP[category_key]
-            else:
-                print(f"[Category Detection] No valid category found")
-                return None
+            category_id = self.CATEGORY_MAP.get(category_key)
+            if category_id is None:
+                logger.debug("[Category Detection] No valid category found")
+            _cache_category(query_norm, category_id)
+            return category_id
 
         except Exception as e:
-            print(f"[Category Detection] Error: {e}")
+            logger.warning("[Category Detection] Error: %s", e)
             return None
 
     async def search_products(
@@ -209,7 +562,7 @@ Category:"""
         max_results: int = 3,
         min_price: float | None = None,
         max_price: float | None = None,
-        fetch_extra: int = 15,
+        fetch_extra: int = 5,
     ) -> list[BestBuyProduct]:
         """Search for products matching a query.
 
@@ -218,7 +571,7 @@ Category:"""
             max_results: Maximum number of results to return (default 3)
             min_price: Minimum price filter (optional)
             max_price: Maximum price filter (optional)
-            fetch_extra: Number of products to fetch for filtering (default 15)
+            fetch_extra: Number of products to fetch for filtering (default 5)
 
         Returns:
             List of BestBuyProduct objects (filtered for relevance)
@@ -226,8 +579,21 @@ Category:"""
         if self.demo_mode:
             return self._get_demo_products(query, max_results)
 
-        # Detect category for better search results
-        category_id = await self._detect_category(query)
+        # Fail fast while the API is known to be down
+        if time.monotonic() < self._open_until:
+            logger.info("[BestBuy API] Circuit open, using demo products")
+            return self._get_demo_products(query, max_results)
+
+        # Detect category for better search results. Keyword and cache hits
+        # resolve here; only LLM detection runs in the background, overlapping
+        # the price estimate and the initial search below
+        query_norm = query.strip().lower()
+        category_known, category_id = self._lookup_category(query_norm)
+        category_task = None
+        if not category_known:
+            category_task = asyncio.create_task(
+                self._detect_category_with_llm(query, query_norm)
+            )
 
         # Estimate price range if not provided
         if min_price is None or max_price is None:
@@ -238,43 +604,142 @@ Category:"""
             effective_min_price = min_price
             effective_max_price = max_price
 
+        # Fetch more products than needed for filtering
+        fetch_count = max(fetch_extra, max_results * 3)
+
+        try:
+            logger.debug("[BestBuy API] Searching for: %s", query)
+
+            if category_task is not None and category_task.done():
+                category_known, category_id = True, category_task.result()
+
+            if category_known:
+                products = await self._fetch_products(self._build_products_url(
+                    query, category_id, effective_min_price,
+                    effective_max_price, fetch_count,
+                ))
+            else:
+                # Race a search without the category filter against category
+                # detection, so the slower of the two sets the latency
+                broad_task = asyncio.create_task(
+                    self._fetch_products(self._build_products_url(
+                        query, None, effective_min_price,
+                        effective_max_price, fetch_count,
+                    ))
+                )
+                await asyncio.wait(
+                    {category_task, broad_task},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if category_task.done() and category_task.result():
+                    broad_task.cancel()
+                    products = await self._fetch_products(
+                        self._build_products_url(
+                            query, category_task.result(),
+                            effective_min_price, effective_max_price,
+                            fetch_count,
+                        )
+                    )
+                else:
+                    if not category_task.done():
+                        # Let detection finish so its result is cached
+                        self._pending_tasks.add(category_task)
+                        category_task.add_done_callback(
+                            self._pending_tasks.discard
+                        )
+                    products = await broad_task
+
+            self._fail_count = 0
+
+            if not products:
+                logger.info("[BestBuy API] No products found, falling back to demo mode")
+                return self._get_demo_products(query, max_results)
+
+            logger.info("[BestBuy API] Fetched %d products", len(products))
+            # Return fetched products - filtering will happen in catalog_agent
+            return products
+
+        except Exception as e:
+            logger.warning("[BestBuy API] Error: %s", e)
+            # Only outages trip the breaker; a 4xx from one malformed query
+            # or an unparseable page says nothing about the API's health
+            if _is_outage(e):
+                self._fail_count += 1
+                if self._fail_count >= self.CIRCUIT_FAILURE_THRESHOLD:
+                    self._open_until = (
+                        time.monotonic() + self.CIRCUIT_OPEN_SECONDS
+                    )
+                    logger.warning(
+                        "[BestBuy API] %d consecutive failures, skipping API "
+                        "for %ds", self._fail_count, self.CIRCUIT_OPEN_SECONDS,
+                    )
+            # Fallback to demo mode on error
+            return self._get_demo_products(query, max_results)
+
+    def _build_products_url(
+        self,
+        query: str,
+        category_id: str | None,
+        min_price: float,
+        max_price: float | None,
+        fetch_count: int,
+    ) -> str:
+        """Build the Products API URL, relative to BASE_URL.
+
+        Args:
+            query: Natural language search query
+            category_id: Best Buy category ID to restrict to (optional)
+            min_price: Minimum price filter; 0 disables it
+            max_price: Maximum price filter; None disables it
+            fetch_count: Page size to request
+
+        Returns:
+            URL path and query string for the products search
+        """
         # Build search criteria
         search_criteria = [f'search={query}']
 
         # Add category filter if detected
         if category_id:
             search_criteria.append(f'categoryPath.id={category_id}')
-            print(f"[BestBuy API] Using category filter: {category_id}")
+            logger.debug("[BestBuy API] Using category filter: %s", category_id)
 
         # Filter out service/warranty products (type=hardgood excludes warranties)
         search_criteria.append('type=hardgood')
 
+        # Drop accessories and consumables the user did not ask for
+        query_lower = query.lower()
+        for term in self.EXCLUDED_NAME_TERMS:
+            wanted = (term, *self.EXCLUSION_ALIASES.get(term, ()))
+            if any(word in query_lower for word in wanted):
+                continue
+            own_category = self.EXCLUSION_CATEGORIES.get(term)
+            if own_category and category_id == self.CATEGORY_MAP[own_category]:
+                continue
+            search_criteria.append(f'name!=*{term}*')
+
         # Apply price filters
-        if effective_min_price > 0:
-            search_criteria.append(f'salePrice>={effective_min_price}')
-            print(f"[BestBuy API] Min price filter: ${effective_min_price}")
+        if min_price > 0:
+            search_criteria.append(f'salePrice>={min_price}')
+            logger.debug("[BestBuy API] Min price filter: $%s", min_price)
 
-        if effective_max_price is not None:
-            search_criteria.append(f'salePrice<={effective_max_price}')
-            print(f"[BestBuy API] Max price filter: ${effective_max_price}")
+        if max_price is not None:
+            search_criteria.append(f'salePrice<={max_price}')
+            logger.debug("[BestBuy API] Max price filter: $%s", max_price)
 
         # Join criteria with &
         criteria = '&'.join(search_criteria)
 
-        # Fields to return
+        # Fields to return (only what the catalog agent uses)
         show_fields = (
-            "sku,name,salePrice,regularPrice,manufacturer,modelNumber,"
-            "shortDescription,image,url,customerReviewAverage,"
-            "inStoreAvailability,onlineAvailability"
+            "sku,name,salePrice,shortDescription,image,url,"
+            "customerReviewAverage"
         )
 
-        # Fetch more products than needed for filtering
-        fetch_count = max(fetch_extra, max_results * 3)
-
         # Sort by customer reviews (most popular products first)
         # This gets actual products, not accessories
-        url = (
-            f"{self.BASE_URL}/products({criteria})"
+        return (
+            f"/products({criteria})"
             f"?apiKey={self.api_key}"
             f"&format=json"
             f"&show={show_fields}"
@@ -282,38 +747,56 @@ Category:"""
             f"&sort=customerReviewCount.desc"  # Most reviewed = most popular
         )
 
-        try:
-            print(f"[BestBuy API] Searching for: {query}")
-            print(f"[BestBuy API] URL: {url}")
+    async def _fetch_products(self, url: str) -> list[BestBuyProduct]:
+        """Fetch and parse one page of products.
 
-            response = await self.client.get(url)
-            response.raise_for_status()
-            data = response.json()
+        Args:
+            url: Products API URL from _build_products_url
 
-            print(f"[BestBuy API] Total results: {data.get('total', 0)}")
+        Returns:
+            Parsed products; entries that fail validation are skipped
 
-            products = []
-            for product_data in data.get("products", []):
-                try:
-                    product = BestBuyProduct(**product_data)
-                    print(f"[BestBuy API] Found: {product.name} - ${product.salePrice}")
-                    products.append(product)
-                except Exception as e:
-                    print(f"[BestBuy API] Error parsing product: {e}")
-                    continue
+        Raises:
+            httpx.HTTPError: If the request fails.
+        """
+        logger.debug("[BestBuy API] URL: %s", url)
 
-            if not products:
-                print(f"[BestBuy API] No products found, falling back to demo mode")
-                return self._get_demo_products(query, max_results)
+        response = await self.client.get(url)
+        response.raise_for_status()
+        data = pydantic_core.from_json(response.content)
 
-            print(f"[BestBuy API] Fetched {len(products)} products, returning top {max_results}")
-            # Return fetched products - filtering will happen in catalog_agent
-            return products
+        logger.debug("[BestBuy API] Total results: %s", data.get("total", 0))
 
-        except Exception as e:
-            print(f"[BestBuy API] Error: {e}")
-            # Fallback to demo mode on error
-            return self._get_demo_products(query, max_results)
+        # Drop entries missing required fields, then validate the rest in one
+        # call; fall back to per-item validation if anything still fails
+        product_dicts = [
+            product_data for product_data in data.get("products", [])
+            if all(
+                product_data.get(field) is not None
+                for field in _REQUIRED_PRODUCT_FIELDS
+            )
+        ]
+        try:
+            products = _PRODUCT_LIST_ADAPTER.validate_python(
+                product_dicts, strict=False
+            )
+        except ValidationError:
+            products = []
+            for product_data in product_dicts:
+                try:
+                    products.append(
+                        BestBuyProduct.model_validate(product_data)
+                    )
+                except ValidationError as e:
+                    logger.debug("[BestBuy API] Error parsing product: %s", e)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for product in products:
+                logger.debug(
+                    "[BestBuy API] Found: %s - $%s",
+                    product.name, product.salePrice,
+                )
+        return products
 
     def _get_demo_products(self, query: str, count: int = 3) -> list[BestBuyProduct]:
         """Generate demo products when API key is not available.
@@ -321,198 +804,54 @@ Category:"""
         This provides realistic-looking data for testing without an API key.
         """
         query_lower = query.lower()
-
-        # Demo product database organized by category
-        demo_catalog = {
-            "coffee": [
-                BestBuyProduct(
-                    sku=6446101,
-                    name="Keurig K-Elite Single-Serve K-Cup Pod Coffee Maker",
-                    salePrice=169.99,
-                    regularPrice=189.99,
-                    manufacturer="Keurig",
-                    modelNumber="K90",
-                    shortDescription="Brew your favorite coffee, tea, hot cocoa and more with this Keurig K-Elite coffee maker.",
-                    image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6446/6446101_sd.jpg",
-                    url="https://www.bestbuy.com/site/6446101.p",
-                    customerReviewAverage=4.5,
-                    inStoreAvailability=True,
-                    onlineAvailability=True,
-                ),
-                BestBuyProduct(
-                    sku=6120833,
-                    name="Ninja 12-Cup Programmable Coffee Maker",
-                    salePrice=89.99,
-                    regularPrice=99.99,
-                    manufacturer="Ninja",
-                    modelNumber="CE251",
-                    shortDescription="Classic coffee maker with advanced features for a perfect cup every time.",
-                    image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6120/6120833_sd.jpg",
-                    url="https://www.bestbuy.com/site/6120833.p",
-                    customerReviewAverage=4.7,
-                    inStoreAvailability=True,
-                    onlineAvailability=True,
-                ),
-                BestBuyProduct(
-                    sku=6372886,
-                    name="Mr. Coffee 5-Cup Mini Brew Coffee Maker",
-                    salePrice=24.99,
-                    regularPrice=29.99,
-                    manufacturer="Mr. Coffee",
-                    modelNumber="BVMC-PSTX",
-                    shortDescription="Compact coffee maker perfect for small spaces.",
-                    image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6372/6372886_sd.jpg",
-                    url="https://www.bestbuy.com/site/6372886.p",
-                    customerReviewAverage=4.2,
-                    inStoreAvailability=True,
-                    onlineAvailability=True,
-                ),
-            ],
-            "laptop": [
-                BestBuyProduct(
-                    sku=6534616,
-                    name="MacBook Air 13.6\" Laptop - Apple M2 chip - 8GB Memory - 256GB SSD",
-                    salePrice=999.99,
-                    regularPrice=1199.99,
-                    manufacturer="Apple",
-                    modelNumber="MLY33LL/A",
-                    shortDescription="Supercharged by M2 chip for incredible performance.",
-                    image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6534/6534616_sd.jpg",
-                    url="https://www.bestbuy.com/site/6534616.p",
-                    customerReviewAverage=4.8,
-                    inStoreAvailability=True,
-                    onlineAvailability=True,
-                ),
-                BestBuyProduct(
-                    sku=6515649,
-                    name="HP 15.6\" Touch-Screen Laptop - Intel Core i5 - 8GB Memory - 256GB SSD",
-                    salePrice=499.99,
-                    regularPrice=599.99,
-                    manufacturer="HP",
-                    modelNumber="15-dy2795wm",
-                    shortDescription="Reliable performance for everyday computing.",
-                    image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6515/6515649_sd.jpg",
-                    url="https://www.bestbuy.com/site/6515649.p",
-                    customerReviewAverage=4.3,
-                    inStoreAvailability=True,
-                    onlineAvailability=True,
-                ),
-                BestBuyProduct(
-                    sku=6542175,
-                    name="Dell Inspiron 2-in-1 14\" Touch-Screen Laptop - Intel Core i7 - 16GB Memory",
-                    salePrice=799.99,
-                    regularPrice=999.99,
-                    manufacturer="Dell",
-                    modelNumber="I7420-7683BLU-PUS",
-                    shortDescription="Versatile 2-in-1 design for work and entertainment.",
-                    image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6542/6542175_sd.jpg",
-                    url="https://www.bestbuy.com/site/6542175.p",
-                    customerReviewAverage=4.6,
-                    inStoreAvailability=False,
-                    onlineAvailability=True,
-                ),
-            ],
-            "headphones": [
-                BestBuyProduct(
-                    sku=6505727,
-                    name="Sony WH-1000XM5 Wireless Noise-Cancelling Over-the-Ear Headphones",
-                    salePrice=349.99,
-                    regularPrice=399.99,
-                    manufacturer="Sony",
-                    modelNumber="WH1000XM5/B",
-                    shortDescription="Industry-leading noise cancellation with premium sound quality.",
-                    image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6505/6505727_sd.jpg",
-                    url="https://www.bestbuy.com/site/6505727.p",
-                    customerReviewAverage=4.9,
-                    inStoreAvailability=True,
-                    onlineAvailability=True,
-                ),
-                BestBuyProduct(
-                    sku=6447909,
-                    name="Apple AirPods Pro (2nd generation) with MagSafe Case",
-                    salePrice=199.99,
-                    regularPrice=249.99,
-                    manufacturer="Apple",
-                    modelNumber="MTJV3AM/A",
-                    shortDescription="Active Noise Cancellation and Transparency mode.",
-                    image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6447/6447909_sd.jpg",
-                    url="https://www.bestbuy.com/site/6447909.p",
-                    customerReviewAverage=4.8,
-                    inStoreAvailability=True,
-                    onlineAvailability=True,
-                ),
-                BestBuyProduct(
-                    sku=6428457,
-                    name="Beats Studio3 Wireless Noise Cancelling Over-Ear Headphones",
-                    salePrice=199.99,
-                    regularPrice=349.99,
-                    manufacturer="Beats by Dr. Dre",
-                    modelNumber="MX3X2LL/A",
-                    shortDescription="Pure adaptive noise canceling with premium sound.",
-                    image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6428/6428457_sd.jpg",
-                    url="https://www.bestbuy.com/site/6428457.p",
-                    customerReviewAverage=4.5,
-                    inStoreAvailability=True,
-                    onlineAvailability=True,
-                ),
-            ],
-            "tv": [
-                BestBuyProduct(
-                    sku=6536735,
-                    name='Samsung 65" Class QLED 4K UHD Smart Tizen TV',
-                    salePrice=897.99,
-                    regularPrice=1299.99,
-                    manufacturer="Samsung",
-                    modelNumber="QN65Q60CAFXZA",
-                    shortDescription="Quantum Dot technology for brilliant colors.",
-                    image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6536/6536735_sd.jpg",
-                    url="https://www.bestbuy.com/site/6536735.p",
-                    customerReviewAverage=4.6,
-                    inStoreAvailability=True,
-                    onlineAvailability=True,
-                ),
-                BestBuyProduct(
-                    sku=6522019,
-                    name='LG 55" Class OLED evo C3 Series Smart TV',
-                    salePrice=1299.99,
-                    regularPrice=1799.99,
-                    manufacturer="LG",
-                    modelNumber="OLED55C3PUA",
-                    shortDescription="Self-lit OLED pixels for perfect black and infinite contrast.",
-                    image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6522/6522019_sd.jpg",
-                    url="https://www.bestbuy.com/site/6522019.p",
-                    customerReviewAverage=4.8,
-                    inStoreAvailability=False,
-                    onlineAvailability=True,
-                ),
-                BestBuyProduct(
-                    sku=6501901,
-                    name='TCL 50" Class S4 4K UHD HDR LED Smart TV with Google TV',
-                    salePrice=249.99,
-                    regularPrice=329.99,
-                    manufacturer="TCL",
-                    modelNumber="50S450G",
-                    shortDescription="Stunning 4K picture quality at an incredible value.",
-                    image="https://pisces.bbystatic.com/image2/BestBuy_US/images/products/6501/6501901_sd.jpg",
-                    url="https://www.bestbuy.com/site/6501901.p",
-                    customerReviewAverage=4.4,
-                    inStoreAvailability=True,
-                    onlineAvailability=True,
-                ),
-            ],
-        }
-
-        # Find matching category
-        for category, products in demo_catalog.items():
-            if category in query_lower:
-                return products[:count]
-
-        # Default: return first available products
-        all_products = []
-        for products in demo_catalog.values():
-            all_products.extend(products)
-        return all_products[:count]
+        products = next(
+            (
+                matches for keyword, matches in _DEMO_KEYWORDS.items()
+                if keyword in query_lower
+            ),
+            _DEFAULT_DEMO_PRODUCTS,
+        )
+        return products[:count]
 
     async def close(self):
         """Close the HTTP client."""
         await self.client.aclose()
+
+
+def _is_outage(error: Exception) -> bool:
+    """Whether a search error means the Best Buy API itself is unavailable."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, (httpx.TimeoutException, httpx.TransportError))
+
+
+_shared_client: BestBuyClient | None = None
+
+
+def get_shared_client() -> BestBuyClient:
+    """Return the process-wide BestBuyClient, creating it on first use.
+
+    Sharing one client keeps its HTTP connection pool and Gemini client alive
+    across workflow invocations instead of rebuilding them per request.
+    Concurrent searches need no extra locking: httpx.AsyncClient pools
+    connections per request, and the client's own state (lazy Gemini client,
+    circuit breaker counters) is only mutated between awaits on one loop.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = BestBuyClient()
+        atexit.register(_close_shared_client)
+    return _shared_client
+
+
+def _close_shared_client() -> None:
+    """Close the shared client's connection pool at interpreter exit."""
+    if _shared_client is None:
+        return
+    try:
+        asyncio.run(_shared_client.close())
+    except Exception:  # pylint: disable=broad-exception-caught
+        # The pool belongs to an event loop that is already gone, so closing
+        # it can fail with loop, transport or anyio errors; the sockets are
+        # reclaimed when the process exits either way.
+        pass
@@ -0,0 +1,229 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Semantic cache for the catalog agent's LLM relevance filter.
+
+Searches that repeat or paraphrase an earlier one, over a similar candidate
+list, reuse the products Gemini picked last time instead of paying for another
+round-trip. Selections are stored as SKUs and only count as a hit when every
+one of them is still among the current candidates. A semantic hit also needs
+the same guard string (the caller's exact-match tokens, such as model numbers)
+as the cached request. Entries are held in memory as a matrix of unit-length
+embeddings and mirrored to SQLite so restarts and other processes reuse them;
+writes happen on a background thread, off the event loop.
+"""
+
+import collections
+from collections.abc import Collection
+from concurrent import futures
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Where the SQLite mirror lives unless SEMANTIC_FILTER_CACHE_DB overrides it.
+_DEFAULT_DB_PATH = ".cache/semantic_filter_cache.db"
+
+
+class SemanticFilterCache:
+  """LRU cache of relevance-filter results matched by cosine similarity."""
+
+  def __init__(
+      self,
+      db_path: str | None = None,
+      maxsize: int = 256,
+      threshold: float = 0.92,
+  ):
+    """Initializes the cache.
+
+    Args:
+      db_path: SQLite file to mirror entries to. None keeps them in memory.
+      maxsize: Maximum number of entries before the least recently used one
+        is evicted.
+      threshold: Minimum cosine similarity for a lookup to count as a hit.
+    """
+    self._maxsize = maxsize
+    self._threshold = threshold
+    # key -> (unit embedding, selected SKUs, guard), least recently used
+    # first.
+    self._entries: collections.OrderedDict[
+        str, tuple[np.ndarray, list[int], str]
+    ] = collections.OrderedDict()
+    # Stacked embeddings and the keys of their rows, rebuilt after inserts.
+    self._matrix: np.ndarray | None = None
+    self._matrix_keys: list[str] = []
+    self._db: sqlite3.Connection | None = None
+    # One worker serializes every SQLite write off the caller's thread.
+    self._writer: futures.ThreadPoolExecutor | None = None
+    if db_path:
+      self._open_db(db_path)
+
+  @staticmethod
+  def key_for(text: str) -> str:
+    """Returns the storage key for a canonical cache string."""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+  def get_exact(
+      self, key: str, available: Collection[int]
+  ) -> list[int] | None:
+    """Returns the cached SKUs for an identical request, if any.
+
+    Args:
+      key: Storage key from key_for().
+      available: SKUs of the current candidate products; a cached SKU missing
+        from them makes the entry a miss.
+    """
+    entry = self._entries.get(key)
+    if entry is None or not all(sku in available for sku in entry[1]):
+      return None
+    self._entries.move_to_end(key)
+    return list(entry[1])
+
+  def has_guard(self, guard: str) -> bool:
+    """Whether any entry could answer a semantic lookup with this guard."""
+    return any(entry[2] == guard for entry in self._entries.values())
+
+  def lookup(
+      self, embedding: np.ndarray, available: Collection[int], guard: str
+  ) -> list[int] | None:
+    """Returns the SKUs selected for the most similar cached request, if any.
+
+    Args:
+      embedding: Embedding of the current request's canonical string.
+      available: SKUs of the current candidate products; a cached SKU missing
+        from them makes the entry a miss.
+      guard: Tokens the cached request must share exactly.
+    """
+    if not self._entries:
+      return None
+    if self._matrix is None:
+      self._matrix_keys = list(self._entries)
+      self._matrix = np.stack(
+          [self._entries[key][0] for key in self._matrix_keys]
+      )
+
+    scores = self._matrix @ _normalize(embedding)
+    same_guard = np.array(
+        [self._entries[key][2] == guard for key in self._matrix_keys]
+    )
+    scores = np.where(same_guard, scores, -np.inf)
+    best = int(np.argmax(scores))
+    if scores[best] < self._threshold:
+      return None
+    return self.get_exact(self._matrix_keys[best], available)
+
+  def insert(
+      self, key: str, embedding: np.ndarray, skus: list[int], guard: str
+  ) -> None:
+    """Adds or replaces an entry, evicting the least recently used ones.
+
+    Args:
+      key: Storage key from key_for().
+      embedding: Embedding of the request's canonical string.
+      skus: SKUs of the products the LLM selected for the request.
+      guard: Tokens a later request must share to reuse this entry.
+    """
+    vector = _normalize(embedding)
+    self._entries[key] = (vector, list(skus), guard)
+    self._entries.move_to_end(key)
+    evicted = []
+    while len(self._entries) > self._maxsize:
+      evicted.append(self._entries.popitem(last=False)[0])
+    self._matrix = None
+
+    if self._writer is not None:
+      self._writer.submit(
+          self._persist,
+          key,
+          vector.tobytes(),
+          json.dumps(skus),
+          guard,
+          evicted,
+      )
+
+  def _persist(
+      self, key: str, blob: bytes, skus: str, guard: str, evicted: list[str]
+  ) -> None:
+    """Writes one insert and its evictions to SQLite, on the writer thread."""
+    try:
+      with self._db:
+        self._db.execute(
+            "INSERT OR REPLACE INTO filter_selections VALUES (?, ?, ?, ?, ?)",
+            (key, blob, skus, guard, time.time()),
+        )
+        self._db.executemany(
+            "DELETE FROM filter_selections WHERE key = ?",
+            [(k,) for k in evicted],
+        )
+    except sqlite3.Error as e:
+      logger.warning("Failed to persist semantic filter cache entry: %s", e)
+
+  def _open_db(self, db_path: str) -> None:
+    """Opens the SQLite mirror and loads its most recent entries."""
+    try:
+      os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+      # Loaded here, then only written from the single writer thread.
+      self._db = sqlite3.connect(db_path, check_same_thread=False)
+      with self._db:
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS filter_selections ("
+            "key TEXT PRIMARY KEY, embedding BLOB, skus TEXT, guard TEXT, "
+            "updated_at REAL)"
+        )
+      rows = self._db.execute(
+          "SELECT key, embedding, skus, guard FROM filter_selections "
+          "ORDER BY updated_at DESC LIMIT ?",
+          (self._maxsize,),
+      ).fetchall()
+    except (OSError, sqlite3.Error) as e:
+      logger.warning("Semantic filter cache running in memory only: %s", e)
+      self._db = None
+      return
+
+    self._writer = futures.ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="semantic-filter-cache"
+    )
+    # Oldest first, so the most recent rows end up most recently used.
+    for key, blob, skus, guard in reversed(rows):
+      self._entries[key] = (
+          np.frombuffer(blob, dtype=np.float32),
+          json.loads(skus),
+          guard,
+      )
+
+
+def _normalize(embedding: np.ndarray) -> np.ndarray:
+  """Returns the embedding as a float32 unit vector."""
+  vector = np.asarray(embedding, dtype=np.float32)
+  norm = np.linalg.norm(vector)
+  return vector / norm if norm else vector
+
+
+_shared_cache: SemanticFilterCache | None = None
+
+
+def get_shared_cache() -> SemanticFilterCache:
+  """Returns the process-wide cache, creating it on first use."""
+  global _shared_cache
+  if _shared_cache is None:
+    _shared_cache = SemanticFilterCache(
+        db_path=os.getenv("SEMANTIC_FILTER_CACHE_DB", _DEFAULT_DB_PATH)
+    )
+  return _shared_cache
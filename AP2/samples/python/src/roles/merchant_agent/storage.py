@@ -34,6 +34,14 @@ def set_cart_mandate(cart_id: str, cart_mandate: CartMandate) -> None:
   _store[cart_id] = cart_mandate
 
 
+def set_cart(
+    cart_id: str, cart_mandate: CartMandate, metadata: dict[str, Any]
+) -> None:
+  """Set a cart mandate and its product metadata by cart ID."""
+  set_cart_mandate(cart_id, cart_mandate)
+  set_cart_metadata(cart_id, metadata)
+
+
 def set_cart_metadata(cart_id: str, metadata: dict[str, Any]) -> None:
   """Set product metadata for a cart (description, image, url, etc.)."""
   _metadata_store[cart_id] = metadata
@@ -17,9 +17,13 @@
 This agent can use Best Buy API for real products or generate mock products.
 """
 
+import asyncio
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
+import functools
+import logging
+import re
 from typing import Any
 
 from a2a.server.tasks.task_updater import TaskUpdater
@@ -28,11 +32,15 @@ from a2a.types import Part
 from a2a.types import Task
 from a2a.types import TextPart
 from google import genai
+import numpy as np
+from pydantic import TypeAdapter
 from pydantic import ValidationError
 
 from .. import storage
-from ..bestbuy_client import BestBuyClient
 from ..bestbuy_client import BestBuyProduct
+from ..bestbuy_client import get_shared_client
+from ..semantic_filter_cache import SemanticFilterCache
+from ..semantic_filter_cache import get_shared_cache
 from ap2.types.mandate import CART_MANDATE_DATA_KEY
 from ap2.types.mandate import CartContents
 from ap2.types.mandate import CartMandate
@@ -46,6 +54,94 @@ from ap2.types.payment_request import PaymentRequest
 from common import message_utils
 from common.system_utils import DEBUG_MODE_INSTRUCTIONS
 
+logger = logging.getLogger(__name__)
+
+# Gemini response schemas, and our own validator for the fallback items
+_INT_LIST_SCHEMA = list[int]
+_PAYMENT_ITEM_LIST_SCHEMA = list[PaymentItem]
+_PAYMENT_ITEM_LIST_ADAPTER = TypeAdapter(_PAYMENT_ITEM_LIST_SCHEMA)
+
+# Payment methods and options offered on every cart; never mutated, so one
+# validated instance is shared by all PaymentRequests.
+_PAYMENT_METHOD_DATA = [
+    PaymentMethodData(
+        supported_methods="CARD",
+        data={
+            "network": ["mastercard", "paypal", "amex"],
+        },
+    )
+]
+_PAYMENT_OPTIONS = PaymentOptions(request_shipping=True)
+
+# Product-name terms that mark accessories, consumables and parts. Matched as
+# word prefixes, so "accessor" also covers "accessories".
+_EXCLUDE_RE = re.compile(
+    r"\b(filter|refill|replacement|cable|adapter|charger|battery|accessor"
+    r"|cleaning)",
+    re.IGNORECASE,
+)
+# Terms that name the same kind of product: chargers are sold as "power
+# adapters", so asking for either one keeps both.
+_EXCLUDE_GROUPS = {"charger": "power", "adapter": "power"}
+
+# Words dropped from search intents by _extract_keywords
+_STOPWORDS = frozenset({
+    "the", "a", "an", "for", "with", "my", "best", "good", "cheap", "find",
+    "show", "me",
+})
+_PUNCT_RE = re.compile(r"[^\w\s-]")
+
+# Intent tokens a semantic cache hit must share exactly: sizes and model
+# numbers ("55", "15", "m2") and model tiers embed almost identically.
+_MODEL_TOKEN_RE = re.compile(
+    r"\b(?:\w*\d\w*|pro|max|mini|plus|ultra|air|se)\b"
+)
+
+# Where a product name's own noun phrase ends and a description of what it
+# goes with starts: "Screen Protector for MacBook Air".
+_NAME_QUALIFIER_RE = re.compile(r"\s(?:for|with|compatible)\s|\s-\s|[,|(]")
+
+# Cache-insert tasks still waiting on their embedding; referenced here so
+# they are not garbage collected mid-flight.
+_pending_cache_inserts: set[asyncio.Task] = set()
+
+# System instruction shared by every relevance-filter request; identical
+# across calls so the server can cache it.
+_FILTER_SYSTEM_INSTRUCTION = """Filter product search results for the user search in the request.
+
+STRICT MATCHING RULES:
+1. Product name MUST contain the main search terms listed under "Key search terms"
+2. Example: "USB cables" requires BOTH "USB" AND "cable" in product name
+3. Example: "USB hard drive" has "USB" but NOT "cable" → REJECT for "USB cables" search
+4. Prioritize products where ALL keywords match
+
+EXCLUSION RULES (unless user explicitly searches for these):
+- If user wants a DEVICE (laptop, TV, phone): EXCLUDE accessories, cables, cases, chargers, filters
+- If user wants ACCESSORIES (cables, chargers): ONLY select those, EXCLUDE devices
+- ALWAYS exclude: warranties, service plans, replacement parts, refills
+
+EXAMPLES:
+User searches "USB cables":
+  ✓ "Anker USB-C to USB-C Cable 6ft" (has USB + cable)
+  ✗ "WD External USB 3.0 Hard Drive" (has USB but NOT cable)
+  ✗ "HDMI Cable 10ft" (has cable but NOT USB)
+
+User searches "MacBook":
+  ✓ "Apple MacBook Air 13-inch M2"
+  ✗ "MacBook Pro USB-C Charging Cable"
+  ✗ "MacBook Case Hard Shell"
+
+User searches "refrigerator":
+  ✓ "Samsung 25 Cu. Ft. French Door Refrigerator"
+  ✗ "Refrigerator Water Filter"
+  ✗ "Refrigerator Air Filter Replacement"
+
+Return ONLY the indices (0-based) of the BEST MATCHING products as a JSON array,
+at most as many as "Products to return".
+If fewer match well, return fewer indices.
+Example response: [0, 5, 12]
+"""
+
 
 async def find_items_workflow(
     data_parts: list[dict[str, Any]],
@@ -58,64 +154,81 @@ async def find_items_workflow(
   )
   intent = intent_mandate.natural_language_description
 
-  # Initialize Best Buy client (will use demo mode if no API key)
-  bestbuy_client = BestBuyClient()
+  # Shared Best Buy client (will use demo mode if no API key)
+  bestbuy_client = get_shared_client()
 
   try:
-    # Search Best Buy for matching products (fetch extra for filtering)
-    products = await bestbuy_client.search_products(
-        query=intent,
-        max_results=3,
-        fetch_extra=15,
+    # Search Best Buy for matching products (fetch extra for filtering) and
+    # build the Gemini client off the event loop while the request is in
+    # flight. Demo products are filtered locally, so they never need it.
+    search_task = asyncio.create_task(
+        bestbuy_client.search_products(
+            query=intent,
+            max_results=3,
+            fetch_extra=5,
+        )
+    )
+    warmup_task = (
+        None
+        if bestbuy_client.demo_mode
+        else asyncio.create_task(asyncio.to_thread(_llm_client))
     )
+    try:
+      products = await search_task
+    finally:
+      if warmup_task:
+        # A failed warm-up is retried, and handled, where the client is used
+        await asyncio.gather(warmup_task, return_exceptions=True)
+
+    # Every cart from this search shares one expiry
+    cart_expiry_iso = (
+        datetime.now(timezone.utc) + timedelta(minutes=30)
+    ).isoformat()
 
-    current_time = datetime.now(timezone.utc)
+    risk_data = _collect_risk_data(updater)
 
     if products:
-      # Use LLM to filter for most relevant products
+      # Keep the most relevant products (LLM only for larger lists)
       try:
         relevant_products = await _filter_relevant_products(
             products, intent, max_results=3
         )
       except Exception as e:
-        print(f"[Catalog Agent] LLM filtering failed: {e}, using first 3 products")
+        logger.warning("LLM filtering failed: %s, using first 3 products", e)
         relevant_products = products[:3]
 
       # If no products after filtering, use first 3
       if not relevant_products:
-        print(f"[Catalog Agent] No products after filtering, using first 3")
+        logger.info("No products after filtering, using first 3")
         relevant_products = products[:3]
 
       # Use real Best Buy products
-      item_count = 0
-      for product in relevant_products:
-        item_count += 1
-        # Convert Best Buy product to PaymentItem
-        payment_item = PaymentItem(
-            label=product.name,
-            amount={
-                "currency": "USD",
-                "value": str(product.salePrice),
-            },
-        )
-        await _create_and_add_cart_mandate_artifact(
-            payment_item,
-            item_count,
-            current_time,
-            updater,
-            merchant_name="Best Buy",
-            product_description=product.shortDescription,
-            product_image=product.image,
-            product_url=product.url,
-        )
+      parts = [
+          _create_cart_mandate_part(
+              # Convert Best Buy product to PaymentItem
+              PaymentItem(
+                  label=product.name,
+                  amount={
+                      "currency": "USD",
+                      "value": str(product.salePrice),
+                  },
+              ),
+              item_count,
+              cart_expiry_iso,
+              merchant_name="Best Buy",
+              product_description=product.shortDescription,
+              product_image=product.image,
+              product_url=product.url,
+          )
+          for item_count, product in enumerate(relevant_products, start=1)
+      ]
     else:
       # Fallback to LLM-generated products if Best Buy returns nothing
-      await _generate_fallback_products(intent, current_time, updater)
+      parts = await _generate_fallback_products(intent, cart_expiry_iso)
 
-    risk_data = _collect_risk_data(updater)
-    updater.add_artifact([
-        Part(root=DataPart(data={"risk_data": risk_data})),
-    ])
+    # Publish every cart and the risk data as a single artifact
+    parts.append(Part(root=DataPart(data={"risk_data": risk_data})))
+    await updater.add_artifact(parts)
     await updater.complete()
 
   except Exception as e:
@@ -124,8 +237,12 @@ async def find_items_workflow(
     )
     await updater.failed(message=error_message)
     return
-  finally:
-    await bestbuy_client.close()
+
+
+@functools.lru_cache(maxsize=1)
+def _llm_client() -> genai.Client:
+  """Returns the Gemini client shared by every catalog request."""
+  return genai.Client()
 
 
 def _extract_keywords(intent: str) -> list[str]:
@@ -137,11 +254,44 @@ def _extract_keywords(intent: str) -> list[str]:
   Returns:
     List of important keywords
   """
-  # Remove common stopwords
-  stopwords = {"the", "a", "an", "for", "with", "my", "best", "good", "cheap", "find", "show", "me"}
-  words = intent.lower().split()
-  keywords = [w for w in words if w not in stopwords and len(w) > 2]
-  return keywords
+  # Remove punctuation (keeping hyphens, e.g. "usb-c") and common stopwords
+  words = _PUNCT_RE.sub(" ", intent.lower()).split()
+  return [w for w in words if len(w) > 2 and w not in _STOPWORDS]
+
+
+def _excluded_terms(text: str) -> set[str]:
+  """Returns the accessory terms in text, with synonyms merged by group."""
+  terms = set()
+  for term in _EXCLUDE_RE.findall(text):
+    term = term.lower()
+    terms.add(_EXCLUDE_GROUPS.get(term, term))
+  return terms
+
+
+def _is_head_match(name: str, stems: list[str]) -> bool:
+  """Whether the stems name the product itself rather than what it fits.
+
+  The stems must all appear before any "for"/"with" qualifier, and only
+  model tokens may follow the last one: "Apple MacBook Air 13-inch M2"
+  matches "macbook", "MacBook Sleeve" and "Case for MacBook" do not.
+  """
+  head = _NAME_QUALIFIER_RE.split(name.lower(), maxsplit=1)[0]
+  words = _PUNCT_RE.sub(" ", head).split()
+  last = -1
+  for stem in stems:
+    positions = [i for i, word in enumerate(words) if stem in word]
+    if not positions:
+      return False
+    last = max(last, positions[-1])
+  return all(
+      any(ch.isdigit() for ch in word) or _MODEL_TOKEN_RE.fullmatch(word)
+      for word in words[last + 1:]
+  )
+
+
+def _name_score(name: str, intent: str) -> int:
+  """Counts the intent words that also appear in a product name."""
+  return len(set(intent.lower().split()) & set(name.lower().split()))
 
 
 async def _filter_relevant_products(
@@ -149,7 +299,7 @@ async def _filter_relevant_products(
     intent: str,
     max_results: int = 3,
 ) -> list[BestBuyProduct]:
-  """Filter products for relevance using LLM.
+  """Filter products for relevance, using the LLM for larger lists.
 
   Args:
     products: List of products from Best Buy API
@@ -159,98 +309,201 @@ async def _filter_relevant_products(
   Returns:
     Filtered list of most relevant products
   """
-  if len(products) <= max_results:
-    return products
-
-  llm_client = genai.Client()
+  # Reject accessories and consumables locally unless the user asked for them
+  wanted = _excluded_terms(intent)
+  products = [p for p in products if _excluded_terms(p.name) <= wanted]
+
+  if len(products) <= max_results * 2:
+    # Small lists are ranked locally; not worth an LLM round-trip
+    return sorted(
+        products,
+        key=lambda p: (
+            -_name_score(p.name, intent),
+            -(p.customerReviewAverage or 0),
+        ),
+    )[:max_results]
 
   # Extract keywords from the search intent
   keywords = _extract_keywords(intent)
   keywords_str = ", ".join(keywords)
 
-  # Create a numbered list of products for the LLM
-  product_list = []
-  for idx, product in enumerate(products):
-    product_list.append({
-        "index": idx,
-        "name": product.name,
-        "price": product.salePrice,
-        "description": product.shortDescription or "",
-    })
+  # Products named by every keyword are clear matches and need no LLM;
+  # plural keywords also match their singular ("cables" -> "cable"). Names
+  # that only mention the keywords as what they fit ("Case for MacBook") are
+  # left for the LLM. Ties keep the better-rated product, then server order.
+  stems = [kw[:-1] if kw.endswith("s") else kw for kw in keywords]
+  hard_matches = []
+  residual = []
+  for product in products:
+    if stems and _is_head_match(product.name, stems):
+      hard_matches.append(product)
+    else:
+      residual.append(product)
+  hard_matches.sort(key=lambda p: (
+      -sum(
+          stem in (p.name + " " + (p.shortDescription or "")).lower()
+          for stem in stems
+      ),
+      -(p.customerReviewAverage or 0),
+  ))
+  if len(hard_matches) >= max_results:
+    return hard_matches[:max_results]
+
+  # Only the unmatched products go to the LLM, for the remaining slots
+  products = residual
+  max_results -= len(hard_matches)
+
+  llm_client = _llm_client()
+
+  # Reuse the selection made for an identical request. Selections are stored
+  # as SKUs, so a hit only counts when every cached product is still offered.
+  cache = get_shared_cache()
+  by_sku = {p.sku: p for p in products}
+  cache_key = SemanticFilterCache.key_for(
+      intent.strip().lower() + "||" + ",".join(map(str, sorted(by_sku)))
+  )
+  cached_skus = cache.get_exact(cache_key, by_sku)
+  if cached_skus:
+    logger.debug("Relevance filter cache hit: %s", cached_skus)
+    return hard_matches + [by_sku[sku] for sku in cached_skus[:max_results]]
 
-  prompt = f"""Filter product search results for: "{intent}"
+  # Create a numbered list of products for the LLM
+  product_lines = "\n".join(
+      f"{i}. {p.name} (${p.salePrice})" for i, p in enumerate(products)
+  )
 
+  # Only request-specific data goes in the contents; the static rules and
+  # examples are sent as the system instruction.
+  prompt = f"""User search: "{intent}"
 Key search terms: {keywords_str}
+Products to return: {max_results}
 
 Available products:
-{'\n'.join([f"{i}. {p['name']} (${p['price']})" for i, p in enumerate(product_list)])}
+{product_lines}
+"""
 
-STRICT MATCHING RULES:
-1. Product name MUST contain the main search terms from: {keywords_str}
-2. Example: "USB cables" requires BOTH "USB" AND "cable" in product name
-3. Example: "USB hard drive" has "USB" but NOT "cable" → REJECT for "USB cables" search
-4. Prioritize products where ALL keywords match
+  # Paraphrase lookups embed the intent together with the candidate names,
+  # and only reuse entries whose model tokens match exactly. The embedding
+  # runs alongside the filter request and is only waited on when an entry
+  # with the same tokens exists; otherwise it just feeds the cache insert.
+  guard = " ".join(sorted(set(_MODEL_TOKEN_RE.findall(intent.lower()))))
+  cache_text = (
+      intent.strip().lower()
+      + "||"
+      + "\n".join(sorted(p.name for p in products))
+  )
+  embed_task = asyncio.create_task(_embed_for_cache(llm_client, cache_text))
+  generate_task = asyncio.create_task(
+      llm_client.aio.models.generate_content(
+          model="gemini-2.5-flash",
+          contents=prompt,
+          config={
+              "system_instruction": _FILTER_SYSTEM_INSTRUCTION,
+              "response_mime_type": "application/json",
+              "response_schema": _INT_LIST_SCHEMA,
+              # A short index array: no reasoning, small decode budget
+              "max_output_tokens": 32,
+              "temperature": 0.0,
+              "candidate_count": 1,
+              "thinking_config": {"thinking_budget": 0},
+          }
+      )
+  )
 
-EXCLUSION RULES (unless user explicitly searches for these):
-- If user wants a DEVICE (laptop, TV, phone): EXCLUDE accessories, cables, cases, chargers, filters
-- If user wants ACCESSORIES (cables, chargers): ONLY select those, EXCLUDE devices
-- ALWAYS exclude: warranties, service plans, replacement parts, refills
+  try:
+    if cache.has_guard(guard):
+      embedding = await embed_task
+      if embedding is not None:
+        cached_skus = cache.lookup(embedding, by_sku, guard)
+        if cached_skus:
+          generate_task.cancel()
+          logger.debug("Relevance filter semantic cache hit: %s", cached_skus)
+          return hard_matches + [
+              by_sku[sku] for sku in cached_skus[:max_results]
+          ]
+
+    llm_response = await generate_task
+    selected_indices: list[int] = llm_response.parsed
+    logger.debug("Relevance filter selected indices: %s", selected_indices)
 
-EXAMPLES:
-User searches "USB cables":
-  ✓ "Anker USB-C to USB-C Cable 6ft" (has USB + cable)
-  ✗ "WD External USB 3.0 Hard Drive" (has USB but NOT cable)
-  ✗ "HDMI Cable 10ft" (has cable but NOT USB)
+    # Return selected products
+    relevant_products = [
+        products[idx] for idx in selected_indices if 0 <= idx < len(products)
+    ]
 
-User searches "MacBook":
-  ✓ "Apple MacBook Air 13-inch M2"
-  ✗ "MacBook Pro USB-C Charging Cable"
-  ✗ "MacBook Case Hard Shell"
+    if logger.isEnabledFor(logging.DEBUG):
+      for product in relevant_products:
+        logger.debug(
+            "Relevance filter selected: %s - $%s",
+            product.name,
+            product.salePrice,
+        )
 
-User searches "refrigerator":
-  ✓ "Samsung 25 Cu. Ft. French Door Refrigerator"
-  ✗ "Refrigerator Water Filter"
-  ✗ "Refrigerator Air Filter Replacement"
+    if relevant_products:
+      _pending_cache_inserts.add(embed_task)
+      embed_task.add_done_callback(
+          functools.partial(
+              _insert_when_embedded,
+              cache,
+              cache_key,
+              [p.sku for p in relevant_products],
+              guard,
+          )
+      )
+      return hard_matches + relevant_products
+    embed_task.cancel()
+    # Nothing else was relevant; padding the keyword matches with residual
+    # products would bring back ones that failed the keyword test
+    return hard_matches or products[:max_results]
 
-Return ONLY the indices (0-based) of the {max_results} BEST MATCHING products as a JSON array.
-If fewer than {max_results} match well, return fewer indices.
-Example response: [0, 5, 12]
-"""
+  except Exception as e:
+    generate_task.cancel()
+    embed_task.cancel()
+    # Same fallback as an empty pick: the keyword matches alone, if any
+    logger.warning("Relevance filter failed: %s", e)
+    return hard_matches or products[:max_results]
 
-  try:
-    llm_response = llm_client.models.generate_content(
-        model="gemini-2.5-flash",
-        contents=prompt,
-        config={
-            "response_mime_type": "application/json",
-            "response_schema": list[int],
-        }
-    )
 
-    selected_indices: list[int] = llm_response.parsed
-    print(f"[Relevance Filter] Selected indices: {selected_indices}")
+async def _embed_for_cache(
+    llm_client: genai.Client, text: str
+) -> np.ndarray | None:
+  """Embeds a canonical request string for the semantic cache.
 
-    # Return selected products
-    relevant_products = []
-    for idx in selected_indices:
-      if 0 <= idx < len(products):
-        relevant_products.append(products[idx])
-        print(f"[Relevance Filter] Selected: {products[idx].name} - ${products[idx].salePrice}")
+  Returns None on failure, so the task never raises.
+  """
+  try:
+    response = await llm_client.aio.models.embed_content(
+        model="text-embedding-004",
+        contents=text,
+    )
+    return np.asarray(response.embeddings[0].values, dtype=np.float32)
+  except Exception as e:
+    logger.warning("Embedding failed, skipping filter cache: %s", e)
+    return None
 
-    return relevant_products if relevant_products else products[:max_results]
 
-  except Exception as e:
-    print(f"[Relevance Filter] Error: {e}, returning first {max_results} products")
-    return products[:max_results]
+def _insert_when_embedded(
+    cache: SemanticFilterCache,
+    key: str,
+    skus: list[int],
+    guard: str,
+    embed_task: asyncio.Task,
+) -> None:
+  """Caches a filter result once its embedding is ready."""
+  _pending_cache_inserts.discard(embed_task)
+  if embed_task.cancelled():
+    return
+  embedding = embed_task.result()
+  if embedding is not None:
+    cache.insert(key, embedding, skus, guard)
 
 
 async def _generate_fallback_products(
     intent: str,
-    current_time: datetime,
-    updater: TaskUpdater,
-) -> None:
-  """Generate products using LLM as fallback."""
-  llm_client = genai.Client()
+    cart_expiry_iso: str,
+) -> list[Part]:
+  """Generate products using LLM as fallback, returning their cart parts."""
+  llm_client = _llm_client()
 
   prompt = f"""
         Based on the user's request for '{intent}', your task is to generate 3
@@ -261,44 +514,34 @@ async def _generate_fallback_products(
     %s
         """ % DEBUG_MODE_INSTRUCTIONS
 
-  llm_response = llm_client.models.generate_content(
+  llm_response = await llm_client.aio.models.generate_content(
       model="gemini-2.5-flash",
       contents=prompt,
       config={
           "response_mime_type": "application/json",
-          "response_schema": list[PaymentItem],
+          "response_schema": _PAYMENT_ITEM_LIST_SCHEMA,
       }
   )
 
-  items: list[PaymentItem] = llm_response.parsed
-  item_count = 0
-  for item in items:
-    item_count += 1
-    await _create_and_add_cart_mandate_artifact(
-        item, item_count, current_time, updater
-    )
+  items = _PAYMENT_ITEM_LIST_ADAPTER.validate_json(llm_response.text)
+  return [
+      _create_cart_mandate_part(item, item_count, cart_expiry_iso)
+      for item_count, item in enumerate(items, start=1)
+  ]
 
 
-async def _create_and_add_cart_mandate_artifact(
+def _create_cart_mandate_part(
     item: PaymentItem,
     item_count: int,
-    current_time: datetime,
-    updater: TaskUpdater,
+    cart_expiry_iso: str,
     merchant_name: str = "Generic Merchant",
     product_description: str | None = None,
     product_image: str | None = None,
     product_url: str | None = None,
-) -> None:
-  """Creates a CartMandate and adds it as an artifact."""
+) -> Part:
+  """Creates and stores a CartMandate, returning it as an artifact part."""
   payment_request = PaymentRequest(
-      method_data=[
-          PaymentMethodData(
-              supported_methods="CARD",
-              data={
-                  "network": ["mastercard", "paypal", "amex"],
-              },
-          )
-      ],
+      method_data=_PAYMENT_METHOD_DATA,
       details=PaymentDetailsInit(
           id=f"order_{item_count}",
           display_items=[item],
@@ -307,14 +550,14 @@ async def _create_and_add_cart_mandate_artifact(
               amount=item.amount,
           ),
       ),
-      options=PaymentOptions(request_shipping=True),
+      options=_PAYMENT_OPTIONS,
   )
 
   cart_contents = CartContents(
       id=f"cart_{item_count}",
       user_cart_confirmation_required=True,
       payment_request=payment_request,
-      cart_expiry=(current_time + timedelta(minutes=30)).isoformat(),
+      cart_expiry=cart_expiry_iso,
       merchant_name=merchant_name,
   )
 
@@ -326,19 +569,16 @@ async def _create_and_add_cart_mandate_artifact(
       "image": product_image,
       "url": product_url,
   }
-  storage.set_cart_metadata(cart_mandate.contents.id, metadata)
-
-  storage.set_cart_mandate(cart_mandate.contents.id, cart_mandate)
+  storage.set_cart(cart_mandate.contents.id, cart_mandate, metadata)
 
-  # Add both cart mandate and metadata as separate data parts
+  # Add both cart mandate and metadata as separate data parts. None fields
+  # stay in the dump: the Android client's nullable fields have no defaults.
   artifact_data = {
-      CART_MANDATE_DATA_KEY: cart_mandate.model_dump(),
+      CART_MANDATE_DATA_KEY: cart_mandate.model_dump(mode="json"),
       f"{CART_MANDATE_DATA_KEY}.metadata": metadata,
   }
 
-  await updater.add_artifact([
-      Part(root=DataPart(data=artifact_data))
-  ])
+  return Part(root=DataPart(data=artifact_data))
 
 
 def _collect_risk_data(updater: TaskUpdater) -> dict:
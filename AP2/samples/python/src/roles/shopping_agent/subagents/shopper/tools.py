@@ -33,6 +33,9 @@ from common.a2a_message_builder import A2aMessageBuilder
 from common.artifact_utils import find_canonical_objects
 from roles.shopping_agent.remote_agents import merchant_agent_client
 
+# DataPart key the merchant uses for a cart's product metadata.
+_CART_METADATA_KEY = f"{CART_MANDATE_DATA_KEY}.metadata"
+
 
 def create_intent_mandate(
     natural_language_description: str,
@@ -107,6 +110,9 @@ async def find_products(
   tool_context.state["shopping_context_id"] = task.context_id
   cart_mandates = _parse_cart_mandates(task.artifacts)
   tool_context.state["cart_mandates"] = cart_mandates
+  tool_context.state["cart_mandates_by_id"] = {
+      cart.contents.id: cart for cart in cart_mandates
+  }
 
   # Extract metadata from artifacts
   metadata_dict = _extract_metadata_from_artifacts(task.artifacts)
@@ -123,14 +129,9 @@ def update_chosen_cart_mandate(cart_id: str, tool_context: ToolContext) -> str:
     cart_id: The ID of the chosen cart.
     tool_context: The ADK supplied tool context.
   """
-  cart_mandates: list[CartMandate] = tool_context.state.get("cart_mandates", [])
-  for cart in cart_mandates:
-    print(
-        f"Checking cart with ID: {cart.contents.id} with chosen ID: {cart_id}"
-    )
-    if cart.contents.id == cart_id:
-      tool_context.state["chosen_cart_id"] = cart_id
-      return f"CartMandate with ID {cart_id} selected."
+  if cart_id in tool_context.state.get("cart_mandates_by_id", {}):
+    tool_context.state["chosen_cart_id"] = cart_id
+    return f"CartMandate with ID {cart_id} selected."
   return f"CartMandate with ID {cart_id} not found."
 
 
@@ -160,16 +161,16 @@ def _extract_metadata_from_artifacts(artifacts: list[Artifact]) -> dict[str, dic
 
   for artifact in artifacts:
     for part in artifact.parts:
-      if hasattr(part.root, 'data') and isinstance(part.root.data, dict):
-        # Look for metadata key
-        metadata_key = f"{CART_MANDATE_DATA_KEY}.metadata"
-        if metadata_key in part.root.data:
-          # Get the corresponding cart mandate to extract cart_id
-          if CART_MANDATE_DATA_KEY in part.root.data:
-            cart_data = part.root.data[CART_MANDATE_DATA_KEY]
-            cart_id = cart_data.get('contents', {}).get('id')
-            if cart_id:
-              metadata_dict[cart_id] = part.root.data[metadata_key]
+      data = getattr(part.root, 'data', None)
+      if not isinstance(data, dict):
+        continue
+      # Metadata travels in the same DataPart as the cart it describes
+      cart_data = data.get(CART_MANDATE_DATA_KEY)
+      metadata = data.get(_CART_METADATA_KEY)
+      if cart_data is not None and metadata is not None:
+        cart_id = cart_data.get('contents', {}).get('id')
+        if cart_id:
+          metadata_dict[cart_id] = metadata
 
   return metadata_dict
 
@@ -193,7 +194,7 @@ def _format_products_with_images(
   if metadata_dict is None:
     metadata_dict = {}
 
-  output = "Here are the available products:\n\n"
+  parts = ["Here are the available products:\n\n"]
 
   for idx, cart in enumerate(cart_mandates, 1):
     item_name = cart.contents.payment_request.details.display_items[0].label
@@ -209,26 +210,26 @@ def _format_products_with_images(
     product_url = metadata.get('url')
 
     # Build product entry
-    output += f"### {idx}. {item_name}\n\n"
+    parts.append(f"### {idx}. {item_name}\n\n")
 
     # Add product image if available
     if image_url:
-      output += f"![{item_name}]({image_url})\n\n"
+      parts.append(f"![{item_name}]({image_url})\n\n")
 
     # Add description if available
     if description:
-      output += f"*{description}*\n\n"
+      parts.append(f"*{description}*\n\n")
 
-    output += f"**Price:** {currency} ${total_price}\n\n"
-    output += f"**Sold by:** {merchant_name}\n\n"
+    parts.append(f"**Price:** {currency} ${total_price}\n\n")
+    parts.append(f"**Sold by:** {merchant_name}\n\n")
 
     # Add product link if available
     if product_url:
-      output += f"[View on {merchant_name} website]({product_url})\n\n"
+      parts.append(f"[View on {merchant_name} website]({product_url})\n\n")
 
-    output += f"**Cart ID:** `{cart_id}`\n\n"
-    output += "---\n\n"
+    parts.append(f"**Cart ID:** `{cart_id}`\n\n")
+    parts.append("---\n\n")
 
-  output += "\nPlease choose which item you'd like to purchase by saying the number (e.g., 'I'll take option 1')."
+  parts.append("\nPlease choose which item you'd like to purchase by saying the number (e.g., 'I'll take option 1').")
 
-  return output
+  return "".join(parts)